@@ -1,9 +1,16 @@
-from typing import Any, Callable, Optional, Type, TypeVar, Union, cast, overload, Tuple, Sequence, Generator
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union, cast, overload, Tuple, Sequence, Generator
 
 from django.db.models import ExpressionWrapper, Expression, F
 from django.db.models.constants import LOOKUP_SEP
 
-from dj_hybrid.expression_wrapper.convert import get_fake_query, get_converters, apply_converters
+from dj_hybrid.expression_wrapper.convert import (
+    BoundConverters,
+    compile_converters,
+    get_connection,
+    get_converters,
+    get_db,
+    get_fake_query,
+)
 from .expression_wrapper.types import Wrapable, SupportsResolving, SupportsConversion, Wrapper
 from .expression_wrapper.wrap import wrap
 from .types import SupportsPython
@@ -20,6 +27,7 @@ class HybridProperty:
         'name',
         '_cached_expression',
         '_instance_method_cache',
+        '_converters_cache',
     )
     is_hybrid = True
 
@@ -32,6 +40,7 @@ class HybridProperty:
         self.name = name or func.__name__
         self._cached_expression = None  # type: Optional['HybridWrapper']
         self._instance_method_cache = None  # type: Optional[InstanceMethodCacheType]
+        self._converters_cache = {}  # type: Dict[str, Optional[BoundConverters]]
 
     @overload
     def __get__(self, instance: T, owner: Optional[Type[T]] = None) -> Any:
@@ -49,6 +58,7 @@ class HybridProperty:
     def reset_cache(self) -> None:
         self._cached_expression = None
         self._instance_method_cache = None
+        self._converters_cache = {}
 
     def __del__(self) -> None:
         self.reset_cache()
@@ -81,9 +91,26 @@ class HybridProperty:
 
         expression, converter_expression = self._instance_method_cache
         value = expression.as_python(instance)
-        converters = get_converters(converter_expression, instance)
-        value = apply_converters(value, converters, instance)
-        return value
+        db = get_db(instance)
+        convert = self._get_converter(converter_expression, instance, db)
+        if convert is None:
+            return value
+        return convert(value, get_connection(db))
+
+    def _get_converter(
+        self,
+        expression: SupportsConversion,
+        instance: T,
+        db: str,
+    ) -> Optional[BoundConverters]:
+        # Finding the converters hashes the expression, which is expensive to do on
+        # every access. They only change with the database being read from.
+        try:
+            return self._converters_cache[db]
+        except KeyError:
+            converters = get_converters(expression, instance)
+            convert = self._converters_cache[db] = compile_converters(converters)
+            return convert
 
 
 class HybridWrapper(ExpressionWrapper):  # type: ignore
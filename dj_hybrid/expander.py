@@ -5,8 +5,9 @@ from django.db.models import ExpressionWrapper, F, Field, FieldDoesNotExist, Mod
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.lookups import Exact, Lookup
 from django.db.models.options import Options
-from dj_hybrid.expression_wrapper.types import Wrapable
-from dj_hybrid.types import Slots
+from dj_hybrid.expression_wrapper.base import compile_wrapped
+from dj_hybrid.expression_wrapper.types import Evaluator, Wrapable
+from dj_hybrid.types import Slots, SupportsPython
 
 from .expression_wrapper.wrap import wrap
 
@@ -160,17 +161,28 @@ class Combineable:
     __slots__ = (
         'lhs',
         'rhs',
+        '_wrapped_lhs',
+        '_wrapped_rhs',
     )  # type: Slots
 
     combiner = None  # type: Callable[[bool, bool], bool]
 
     def __init__(self, lhs: Wrapable, rhs: Wrapable) -> None:
         self.lhs, self.rhs = lhs, rhs
+        self._wrapped_lhs = wrap(lhs)  # type: SupportsPython
+        self._wrapped_rhs = wrap(rhs)  # type: SupportsPython
 
     def as_python(self, obj: Any) -> bool:
-        wrapped_lhs = wrap(self.lhs)
-        wrapped_rhs = wrap(self.rhs)
-        return type(self).combiner(wrapped_lhs.as_python(obj), wrapped_rhs.as_python(obj))
+        return type(self).combiner(self._wrapped_lhs.as_python(obj), self._wrapped_rhs.as_python(obj))
+
+    def compile(self) -> Evaluator:
+        lhs = compile_wrapped(self._wrapped_lhs)
+        rhs = compile_wrapped(self._wrapped_rhs)
+        combiner = type(self).combiner
+
+        def evaluate(obj: Any) -> bool:
+            return combiner(lhs(obj), rhs(obj))
+        return evaluate
 
 
 class And(Combineable):
@@ -184,13 +196,21 @@ class Or(Combineable):
 
 
 class Not:
-    __slots__ = ('expression', )  # type: Slots
+    __slots__ = ('expression', '_wrapped_expression')  # type: Slots
 
     def __init__(self, expression: Wrapable) -> None:
         self.expression = expression
+        self._wrapped_expression = wrap(expression)  # type: SupportsPython
 
     def as_python(self, obj: Any) -> bool:
-        return not wrap(self.expression).as_python(obj)
+        return not self._wrapped_expression.as_python(obj)
+
+    def compile(self) -> Evaluator:
+        expression = compile_wrapped(self._wrapped_expression)
+
+        def evaluate(obj: Any) -> bool:
+            return not expression(obj)
+        return evaluate
 
 
 class EmptyQuery:
@@ -200,5 +220,8 @@ class EmptyQuery:
     def as_python(obj: Any) -> bool:
         return True
 
+    def compile(self) -> Evaluator:
+        return self.as_python
+
     def __eq__(self, other: Any) -> bool:
         return type(self) is type(other)
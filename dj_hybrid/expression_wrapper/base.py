@@ -1,9 +1,19 @@
 import copy
+from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, Tuple, TypeVar, Type, Dict, Optional, ClassVar, cast
 
-from dj_hybrid.types import SupportsPython
+from dj_hybrid.types import SupportsPython, Slots
+from dj_hybrid.utils import implements
 
-from .types import Wrapable, Wrapper, SupportsConversion, SupportsResolving, SupportsCopy
+from .types import (
+    Evaluator,
+    SupportsCompiling,
+    SupportsConversion,
+    SupportsCopy,
+    SupportsResolving,
+    Wrapable,
+    Wrapper,
+)
 
 if TYPE_CHECKING:
     from django.db.models import Q, Model, Field
@@ -71,9 +81,9 @@ class ExpressionWrapper(Wrapper, Generic[T_Wrapable]):
 
         c = copy.copy(self)  # type: ExpressionWrapper[Wrapable]
         c._is_resolved = True
-        if isinstance(c.expression, SupportsResolving):
+        if implements(c.expression, SupportsResolving):
             c.expression = c.expression.resolve_expression(query)
-        elif isinstance(c.expression, SupportsCopy):
+        elif implements(c.expression, SupportsCopy):
             c.expression = c.expression.copy()
         else:
             c.expression = copy.copy(c.expression)
@@ -81,3 +91,65 @@ class ExpressionWrapper(Wrapper, Generic[T_Wrapable]):
 
     def get_for_conversion(self) -> SupportsConversion:
         return cast(SupportsConversion, self.expression)
+
+    def is_constant(self) -> bool:
+        """Whether this evaluates to the same value, regardless of the object"""
+        return False
+
+
+class CompiledExpressionWrapper(ExpressionWrapper[T_Wrapable]):
+    """Evaluate through a callable built once by `compile`
+
+    Wrapping the sub-expressions, and picking the operators to apply to them,
+    doesn't depend on the object being evaluated. Doing it in `compile` leaves
+    only the evaluation itself to be repeated for every object.
+    """
+    __slots__ = (
+        '_compiled',
+    )  # type: Slots
+
+    def __init__(self, expression: T_Wrapable) -> None:
+        super().__init__(expression)
+        self._compiled = None  # type: Optional[Evaluator]
+
+    def as_python(self, obj: Any) -> Any:
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = compile_wrapped(self)
+        return compiled(obj)
+
+    @abstractmethod
+    def compile(self) -> Evaluator:
+        ...
+
+    def resolve_expression(self, query: FakeQuery) -> SupportsPython:
+        if self._is_resolved:
+            return self
+
+        c = cast(CompiledExpressionWrapper[Wrapable], super().resolve_expression(query))
+        # the copy shares our compiled callable, which was built from the unresolved expression
+        c._compiled = None
+        return c
+
+
+def compile_wrapped(wrapped: SupportsPython) -> Evaluator:
+    if implements(wrapped, SupportsCompiling):
+        compiled = cast(SupportsCompiling, wrapped).compile()
+    else:
+        compiled = wrapped.as_python
+    if not is_constant(wrapped):
+        return compiled
+
+    try:
+        value = compiled(None)
+    except Exception:
+        # leave any error to be raised when it's actually evaluated
+        return compiled
+
+    def evaluate(obj: Any) -> Any:
+        return value
+    return evaluate
+
+
+def is_constant(wrapped: SupportsPython) -> bool:
+    return isinstance(wrapped, ExpressionWrapper) and wrapped.is_constant()
@@ -39,30 +39,41 @@ def get_converters_with_compiler(
     return converters[0]
 
 
+BoundConverters = Callable[[Any, BaseDatabaseWrapper], Any]
+
+
 if django.VERSION >= (2,):
-    def apply_converters(value: Any, converters_paired: ConvertersExpressionPair, model: Model) -> Any:
-        if not converters_paired[0]:
-            return value
+    def compile_converters(converters_paired: ConvertersExpressionPair) -> Optional[BoundConverters]:
+        """Bind the converters, so only the value and connection are left to pass in
 
-        db = get_db(model)
-        connection = get_connection(db)
+        Connections are per thread, so can't be bound along with them.
+        """
         converters, expression = converters_paired
-        for converter in converters:
-            converter = cast(ConverterNew, converter)
-            value = converter(value, expression, connection)
-        return value
-else:
-    def apply_converters(value: Any, converters_paired: ConvertersExpressionPair, model: Model) -> Any:
-        if not converters_paired[0]:
+        if not converters:
+            return None
+
+        def convert(value: Any, connection: BaseDatabaseWrapper) -> Any:
+            for converter in converters:
+                converter = cast(ConverterNew, converter)
+                value = converter(value, expression, connection)
             return value
+        return convert
+else:
+    def compile_converters(converters_paired: ConvertersExpressionPair) -> Optional[BoundConverters]:
+        """Bind the converters, so only the value and connection are left to pass in
 
-        db = get_db(model)
-        connection = get_connection(db)
+        Connections are per thread, so can't be bound along with them.
+        """
         converters, expression = converters_paired
-        for converter in converters:
-            converter = cast(ConverterOld, converter)
-            value = converter(value, expression, connection, {})
-        return value
+        if not converters:
+            return None
+
+        def convert(value: Any, connection: BaseDatabaseWrapper) -> Any:
+            for converter in converters:
+                converter = cast(ConverterOld, converter)
+                value = converter(value, expression, connection, {})
+            return value
+        return convert
 
 
 def get_db(obj: Union[Any, Type[Any]]) -> str:
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from django.db.models.sql import Query
 
 Wrapable = Any
+Evaluator = Callable[[Any], Any]
 _T_C = TypeVar('_T_C')
 
 
@@ -48,6 +49,14 @@ class SupportsCopy(Protocol):
         ...
 
 
+@runtime
+class SupportsCompiling(Protocol):
+    __slots__ = ()  # type: Slots
+
+    def compile(self) -> Evaluator:
+        ...
+
+
 @runtime
 class Wrapper(SupportsPython, Protocol):
     __slots__ = ()  # type: Slots
@@ -1,6 +1,7 @@
-from typing import Type, Union
+from typing import Type, Union, cast
 
 from dj_hybrid.types import SupportsPython
+from dj_hybrid.utils import implements
 
 from .registry import registry
 from .types import TypeWrapperOrProxy, Wrapable
@@ -17,8 +18,8 @@ def wrap(expression: Wrapable) -> SupportsPython:
     :param expression:
     :return:
     """
-    if isinstance(expression, SupportsPython):
-        return expression
+    if supports_python(expression):
+        return cast(SupportsPython, expression)
 
     wrapper = get_wrapper(expression)
     return wrapper(expression)
@@ -28,3 +29,7 @@ def get_wrapper(expression: Union[Wrapable, Type[Wrapable]]) -> TypeWrapperOrPro
     if not isinstance(expression, type):
         expression = type(expression)
     return registry.get(expression)
+
+
+def supports_python(expression: Wrapable) -> bool:
+    return implements(expression, SupportsPython)
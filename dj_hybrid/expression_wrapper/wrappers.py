@@ -1,20 +1,25 @@
 import decimal
+import math
 import operator
 import re
 import statistics
 from contextlib import suppress
 from datetime import date, datetime
+from functools import lru_cache
 from typing import (
     Any,
     AnyStr,
     Callable,
     Container,
     Dict,
-    Generator,
     Generic,
     Iterable,
+    List,
     Optional,
+    Pattern,
+    Sequence,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -78,13 +83,25 @@ from django.utils.crypto import random
 from django.utils.dateparse import parse_date, parse_datetime, parse_duration, parse_time
 from django.utils.encoding import force_bytes, force_text
 
+try:
+    import numpy
+except ImportError:  # numpy is optional, see the `numpy` extra
+    numpy = None
+
 from dj_hybrid.expander import expand_query
 from dj_hybrid.expression_wrapper.convert import get_connection, get_db
-from dj_hybrid.expression_wrapper.types import SupportsResolving
-from dj_hybrid.resolve import get_resolver
+from dj_hybrid.expression_wrapper.types import Evaluator, SupportsResolving
+from dj_hybrid.resolve import get_accessor
 from dj_hybrid.types import SupportsPython, SupportsPythonComparison, Slots
-
-from .base import ExpressionWrapper, FakeQuery
+from dj_hybrid.utils import implements
+
+from .base import (
+    CompiledExpressionWrapper,
+    ExpressionWrapper,
+    FakeQuery,
+    compile_wrapped,
+    is_constant,
+)
 from .registry import register
 from .wrap import wrap
 
@@ -128,7 +145,7 @@ def _get_output_field(expression: Expression) -> Optional[Field]:
 
 @register(Value)
 @register(DurationValue)
-class ValueWrapper(ExpressionWrapper[Union[Value, DurationValue]]):
+class ValueWrapper(CompiledExpressionWrapper[Union[Value, DurationValue]]):
     __slots__ = (
         '_resolved_value',
     )  # type: Slots
@@ -137,8 +154,15 @@ class ValueWrapper(ExpressionWrapper[Union[Value, DurationValue]]):
         super().__init__(expression)
         self._resolved_value = _UNSET  # type: Any
 
-    def as_python(self, obj: Any) -> Any:
-        return self.get_value()
+    def is_constant(self) -> bool:
+        return True
+
+    def compile(self) -> Evaluator:
+        value = self.get_value()
+
+        def evaluate(obj: Any) -> Any:
+            return value
+        return evaluate
 
     def get_value(self) -> Any:
         if self._resolved_value is not _UNSET:
@@ -156,8 +180,53 @@ class ValueWrapper(ExpressionWrapper[Union[Value, DurationValue]]):
         return c
 
 
+# The common arithmetic connectors get the operator inlined into their closure,
+# saving a call per row over going through the `operator` module.
+def _compile_add(lhs: Evaluator, rhs: Evaluator) -> Evaluator:
+    def evaluate(obj: Any) -> Any:
+        return lhs(obj) + rhs(obj)
+    return evaluate
+
+
+def _compile_sub(lhs: Evaluator, rhs: Evaluator) -> Evaluator:
+    def evaluate(obj: Any) -> Any:
+        return lhs(obj) - rhs(obj)
+    return evaluate
+
+
+def _compile_mul(lhs: Evaluator, rhs: Evaluator) -> Evaluator:
+    def evaluate(obj: Any) -> Any:
+        return lhs(obj) * rhs(obj)
+    return evaluate
+
+
+def _compile_div(lhs: Evaluator, rhs: Evaluator) -> Evaluator:
+    def evaluate(obj: Any) -> Any:
+        return lhs(obj) / rhs(obj)
+    return evaluate
+
+
+_specialised_connectors = {
+    Combinable.ADD: _compile_add,
+    Combinable.SUB: _compile_sub,
+    Combinable.MUL: _compile_mul,
+    Combinable.DIV: _compile_div,
+}  # type: Dict[str, Callable[[Evaluator, Evaluator], Evaluator]]
+
+
+def _compile_chain(operands: Tuple[Evaluator, ...], op: Callable[[Any, Any], Any]) -> Evaluator:
+    first, rest = operands[0], operands[1:]
+
+    def evaluate(obj: Any) -> Any:
+        value = first(obj)
+        for operand in rest:
+            value = op(value, operand(obj))
+        return value
+    return evaluate
+
+
 @register(CombinedExpression)
-class CombinedExpressionWrapper(ExpressionWrapper[CombinedExpression]):
+class CombinedExpressionWrapper(CompiledExpressionWrapper[CombinedExpression]):
     __slots__ = ()  # type: Slots
 
     _connectors = {
@@ -172,15 +241,47 @@ class CombinedExpressionWrapper(ExpressionWrapper[CombinedExpression]):
         Combinable.BITRIGHTSHIFT: operator.rshift,
     }  # type: Dict[str, Callable[[Any, Any], Any]]
 
-    def as_python(self, obj: Any) -> Any:
-
-        lhs_wrapped = wrap(self.expression.lhs)
-        rhs_wrapped = wrap(self.expression.rhs)
-        lhs = lhs_wrapped.as_python(obj)
-        rhs = rhs_wrapped.as_python(obj)
+    def compile(self) -> Evaluator:
+        operands = self.get_chained_operands()
+        if len(operands) > 2:
+            return _compile_chain(
+                tuple(compile_wrapped(operand) for operand in operands),
+                self._get_operator(),
+            )
+
+        lhs, rhs = (compile_wrapped(operand) for operand in operands)
+        specialised = _specialised_connectors.get(self.expression.connector)
+        if specialised is not None:
+            return specialised(lhs, rhs)
         op = self._get_operator()
-        value = op(lhs, rhs)
-        return value
+
+        def evaluate(obj: Any) -> Any:
+            return op(lhs(obj), rhs(obj))
+        return evaluate
+
+    def is_constant(self) -> bool:
+        return is_constant(wrap(self.expression.lhs)) and is_constant(wrap(self.expression.rhs))
+
+    def get_chained_operands(self) -> List[SupportsPython]:
+        """The operands of a chain of this connector, such as `a`, `b` and `c` of `(a + b) + c`
+
+        A chain lets all of its operands be combined in a single loop, rather than
+        calling into another level of nesting for each of them.
+        """
+        connector = self.expression.connector
+        operands = [wrap(self.expression.rhs)]
+        lhs = wrap(self.expression.lhs)
+        while (
+            isinstance(lhs, CombinedExpressionWrapper)
+            and lhs.expression.connector == connector
+            # which are better left to be folded into a single value
+            and not lhs.is_constant()
+        ):
+            operands.append(wrap(lhs.expression.rhs))
+            lhs = wrap(lhs.expression.lhs)
+        operands.append(lhs)
+        operands.reverse()
+        return operands
 
     def _get_operator(self) -> Callable[[Any, Any], Any]:
         connector = self.expression.connector  # type: str
@@ -188,37 +289,46 @@ class CombinedExpressionWrapper(ExpressionWrapper[CombinedExpression]):
         return op
 
 
-@register(Col)
-class ColWrapper(ExpressionWrapper[Col]):
-    __slots__ = ()  # type: Slots
+def _compile_path(path: str) -> Evaluator:
+    # the accessor depends only on the type of the object, so is built once for each
+    accessors = {}  # type: Dict[type, Callable[[Any], Any]]
 
-    def as_python(self, obj: Any) -> Any:
-        resolver = get_resolver(obj)
-        resolved = resolver.resolve(self.expression.alias)
+    def evaluate(obj: Any) -> Any:
+        obj_type = type(obj)
+        try:
+            accessor = accessors[obj_type]
+        except KeyError:
+            accessor = accessors[obj_type] = get_accessor(obj_type, path)
+        resolved = accessor(obj)
 
         # This behaviour might not be right, but everything I've seen suggests it..
         # We need to turn a model instance into its PK value.
         if isinstance(resolved, Model):
             return resolved.pk
         return resolved
+    return evaluate
+
+
+@register(Col)
+class ColWrapper(CompiledExpressionWrapper[Col]):
+    __slots__ = ()  # type: Slots
+
+    def compile(self) -> Evaluator:
+        return _compile_path(self.expression.alias)
 
 
 @register(F)
-class FWrapper(ExpressionWrapper[F]):
+class FWrapper(CompiledExpressionWrapper[F]):
     __slots__ = ()  # type: Slots
 
-    def as_python(self, obj: Any) -> Any:
-        resolver = get_resolver(obj)
-        resolved = resolver.resolve(self.expression.name)
-        if isinstance(resolved, Model):
-            return resolved.pk
-        return resolved
+    def compile(self) -> Evaluator:
+        return _compile_path(self.expression.name)
 
     def resolve_expression(self, query: FakeQuery) -> SupportsPython:
         new_expression = self.expression.resolve_expression(query)
         wrapped = wrap(new_expression)
-        if isinstance(wrapped, SupportsResolving):
-            wrapped = wrapped.resolve_expression(query)
+        if implements(wrapped, SupportsResolving):
+            wrapped = cast(SupportsResolving, wrapped).resolve_expression(query)
         return wrapped
 
 
@@ -244,36 +354,62 @@ class RandomWrapper(ExpressionWrapper[Random]):
 
 
 @register(DjangoExpressionWrapper)
-class ExpressionWrapperWrapper(ExpressionWrapper[DjangoExpressionWrapper]):
+class ExpressionWrapperWrapper(CompiledExpressionWrapper[DjangoExpressionWrapper]):
     __slots__ = ()  # type: Slots
 
-    def as_python(self, obj: Any) -> Any:
-        wrapped = wrap(self.expression.expression)
-        value = wrapped.as_python(obj)
-        return value
+    def compile(self) -> Evaluator:
+        # this only carries the output field, which is used for conversion.
+        # Evaluating is done entirely by what it wraps.
+        return compile_wrapped(wrap(self.expression.expression))
+
+    def is_constant(self) -> bool:
+        return is_constant(wrap(self.expression.expression))
 
 
 T_Func = TypeVar('T_Func', bound=Func)
 
 
-class FuncWrapper(ExpressionWrapper[Func], Generic[T_Func]):
+class FuncWrapper(CompiledExpressionWrapper[Func], Generic[T_Func]):
     __slots__ = ()  # type: Slots
     op = None  # type: ClassVar[Callable]
 
-    def as_python(self, obj: Any) -> Any:
-        input_values = self.get_source_values(obj)
+    def compile(self) -> Evaluator:
+        sources = self.get_compiled_sources()
         op = self.get_op()
-        output_value = op(*input_values)
-        return output_value
 
-    def get_source_values(self, obj: Any) -> Generator[Any, None, None]:
-        for expression in self.expression.source_expressions:
-            wrapped = wrap(expression)
-            yield wrapped.as_python(obj)
+        # most functions take one or two arguments, which can be passed
+        # without building a list to unpack for every row
+        if len(sources) == 1:
+            source, = sources
+
+            def evaluate_one(obj: Any) -> Any:
+                return op(source(obj))
+            return evaluate_one
+
+        if len(sources) == 2:
+            first, second = sources
+
+            def evaluate_two(obj: Any) -> Any:
+                return op(first(obj), second(obj))
+            return evaluate_two
+
+        def evaluate(obj: Any) -> Any:
+            return op(*[source(obj) for source in sources])
+        return evaluate
+
+    def get_compiled_sources(self) -> Tuple[Evaluator, ...]:
+        return tuple(
+            compile_wrapped(wrap(expression))
+            for expression in self.expression.source_expressions
+        )
 
     def get_op(self) -> Callable:
         return type(self).op
 
+    def is_constant(self) -> bool:
+        sources = self.expression.source_expressions
+        return bool(sources) and all(is_constant(wrap(source)) for source in sources)
+
 
 T_Aggregate = TypeVar('T_Aggregate', bound=Aggregate)
 
@@ -281,12 +417,75 @@ T_Aggregate = TypeVar('T_Aggregate', bound=Aggregate)
 class AggregateWrapper(FuncWrapper[Aggregate], Generic[T_Aggregate]):
     __slots__ = ()  # type: Slots
     op = None  # type: ClassVar[Callable[[Iterable[Any]], Any]]
+    # Takes a numpy array, and is used in place of `op` for numeric values when
+    # numpy is installed. Building the array isn't free, so this is only worth
+    # setting when `op` does its work in python, and only used for at least
+    # `numpy_min_values` values.
+    numpy_op = None  # type: ClassVar[Optional[Callable[[Any], Any]]]
+    numpy_min_values = 128  # type: ClassVar[int]
+
+    def get_op(self) -> Callable:
+        op = super().get_op()
+        numpy_op = type(self).numpy_op
+        if numpy is None or numpy_op is None:
+            return op
+
+        array_op = numpy_op  # type: Callable[[Any], Any]
+        min_values = type(self).numpy_min_values
+
+        def reduce(values: Iterable[Any]) -> Any:
+            if isinstance(values, (list, tuple)) and len(values) >= min_values:
+                array = numpy.asarray(values)
+                if array.dtype.kind in 'iuf':
+                    return array_op(array).item()
+            return op(values)
+        return reduce
+
+
+# The `statistics` module is exact, working through fractions, which is
+# far slower than needed to match what the database would give us.
+def _mean(values: Iterable[Any]) -> Any:
+    sized = values if isinstance(values, Sequence) else list(values)  # type: Sequence[Any]
+    if not sized:
+        raise statistics.StatisticsError('mean requires at least one data point')
+    return sum(sized) / len(sized)
+
+
+def _variance(values: Iterable[Any]) -> Any:
+    # Welford's algorithm, which needs only the one pass
+    count = 0
+    mean = 0  # type: Any
+    squared_distances = 0  # type: Any
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        squared_distances += delta * (value - mean)
+    if count < 2:
+        raise statistics.StatisticsError('variance requires at least two data points')
+    return squared_distances / (count - 1)
+
+
+def _stdev(values: Iterable[Any]) -> Any:
+    variance = _variance(values)
+    if isinstance(variance, decimal.Decimal):
+        return variance.sqrt()
+    return math.sqrt(variance)
+
+
+def _numpy_variance(values: Any) -> Any:
+    return values.var(ddof=1)
+
+
+def _numpy_stdev(values: Any) -> Any:
+    return values.std(ddof=1)
 
 
 @register(Avg)
 class AvgWrapper(AggregateWrapper[Avg]):
     __slots__ = ()  # type: Slots
-    op = statistics.mean
+    # `sum` is quicker than building an array, however many values there are
+    op = _mean
 
 
 @register(Count)
@@ -310,7 +509,8 @@ class MinWrapper(AggregateWrapper[Min]):
 @register(StdDev)
 class StdDevWrapper(AggregateWrapper[StdDev]):
     __slots__ = ()  # type: Slots
-    op = statistics.stdev
+    op = _stdev
+    numpy_op = _numpy_stdev
 
 
 @register(Sum)
@@ -322,7 +522,8 @@ class SumWrapper(AggregateWrapper[Sum]):
 @register(Variance)
 class VarianceWrapper(AggregateWrapper[Variance]):
     __slots__ = ()  # type: Slots
-    op = statistics.variance
+    op = _variance
+    numpy_op = _numpy_variance
 
 
 Cast_T = TypeVar('Cast_T')
@@ -383,15 +584,46 @@ class CoalesceWrapper(FuncWrapper[Coalesce]):
             None
         )
 
+    def compile(self) -> Evaluator:
+        # sources after the first one with a value don't need evaluating at all
+        sources = self.get_compiled_sources()
+        if len(sources) == 2:
+            first, second = sources
+
+            def evaluate_two(obj: Any) -> Any:
+                value = first(obj)
+                if value is not None:
+                    return value
+                return second(obj)
+            return evaluate_two
+
+        def evaluate(obj: Any) -> Any:
+            for source in sources:
+                value = source(obj)
+                if value is not None:
+                    return value
+            return None
+        return evaluate
+
 
 @register(ConcatPair)
+class ConcatPairWrapper(FuncWrapper[ConcatPair]):
+    __slots__ = ()  # type: Slots
+
+    @staticmethod
+    def op(lhs: Any, rhs: Any) -> str:
+        if isinstance(lhs, str) and isinstance(rhs, str):
+            return lhs + rhs
+        return str(lhs) + str(rhs)
+
+
 @register(Concat)
-class ConcatPairWrapper(FuncWrapper[Union[Concat, ConcatPair]]):
+class ConcatWrapper(FuncWrapper[Concat]):
     __slots__ = ()  # type: Slots
 
     @staticmethod
-    def op(*values: str) -> str:
-        return ''.join(str(v) for v in values)
+    def op(*values: Any) -> str:
+        return ''.join(map(str, values))
 
 
 @register(Greatest)
@@ -418,6 +650,23 @@ T_Transform = TypeVar('T_Transform', bound=Transform)
 class TransformWrapper(FuncWrapper[Transform], Generic[T_Transform]):
     __slots__ = ()  # type: Slots
     op = None  # type: ClassVar[Callable[[Any], Any]]
+    # Falsy values, such as None or '', are returned as they are, rather than
+    # given to `op`. Lets `op` be something that runs entirely in C, such as a
+    # `methodcaller`.
+    passes_falsy = False  # type: ClassVar[bool]
+
+    def compile(self) -> Evaluator:
+        if not type(self).passes_falsy:
+            return super().compile()
+        source, = self.get_compiled_sources()
+        op = self.get_op()
+
+        def evaluate(obj: Any) -> Any:
+            value = source(obj)
+            if not value:
+                return value
+            return op(value)
+        return evaluate
 
 
 @register(Now)
@@ -445,22 +694,16 @@ class NowWrapper(ExpressionWrapper[Now]):
 class LowerWrapper(TransformWrapper[Lower]):
     __slots__ = ()  # type: Slots
 
-    @staticmethod
-    def op(value: AnyStr) -> AnyStr:
-        if value:
-            return value.lower()
-        return value
+    op = operator.methodcaller('lower')
+    passes_falsy = True
 
 
 @register(Upper)
 class UpperWrapper(TransformWrapper[Upper]):
     __slots__ = ()  # type: Slots
 
-    @staticmethod
-    def op(value: AnyStr) -> AnyStr:
-        if value:
-            return value.upper()
-        return value
+    op = operator.methodcaller('upper')
+    passes_falsy = True
 
 
 try:
@@ -484,16 +727,34 @@ else:
 T_Lookup = TypeVar('T_Lookup', bound=Lookup)
 
 
-class LookupWrapper(ExpressionWrapper[Lookup], Generic[T_Lookup]):
+class LookupWrapper(CompiledExpressionWrapper[Lookup], Generic[T_Lookup]):
     __slots__ = ()  # type: Slots
     op = None  # type: Callable[[Any, Any], bool]
 
-    def as_python(self, obj: Any) -> bool:
-        lhs_wrapped = wrap(self.expression.lhs)
+    def compile(self) -> Evaluator:
+        lhs = compile_wrapped(wrap(self.expression.lhs))
         rhs_wrapped = self.get_wrapped_rhs()
-        lhs_value = lhs_wrapped.as_python(obj)
-        rhs_value = rhs_wrapped.as_python(obj)
-        return type(self).op(lhs_value, rhs_value)
+        if isinstance(rhs_wrapped, ValueWrapper):
+            return self.compile_constant(lhs, rhs_wrapped.get_value())
+
+        rhs = compile_wrapped(rhs_wrapped)
+        op = type(self).op
+
+        def evaluate(obj: Any) -> bool:
+            return op(lhs(obj), rhs(obj))
+        return evaluate
+
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        # the right hand side is usually a plain value, so anything derived
+        # from it only needs working out once.
+        op = type(self).op
+
+        def evaluate(obj: Any) -> bool:
+            return op(lhs(obj), rhs)
+        return evaluate
+
+    def is_constant(self) -> bool:
+        return is_constant(wrap(self.expression.lhs)) and is_constant(self.get_wrapped_rhs())
 
     def get_wrapped_rhs(self) -> SupportsPython:
         rhs = self.expression.rhs
@@ -518,6 +779,19 @@ class IExactWrapper(LookupWrapper[IExact]):
             return lhs.lower() == rhs.lower()
         return lhs == rhs
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        if not rhs:
+            return super().compile_constant(lhs, rhs)
+        lowered = rhs.lower()  # type: str
+
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: str
+            if value:
+                return value.lower() == lowered
+            # an empty value can't match a non-empty one
+            return False
+        return evaluate
+
 
 # TODO: python doesn't like comparing different types. investigate.
 
@@ -556,12 +830,37 @@ class InWrapper(LookupWrapper[In]):
         # TODO: support querysets?
         return lhs in rhs
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        if not isinstance(rhs, (list, tuple, set, frozenset)):
+            return super().compile_constant(lhs, rhs)
+        try:
+            members = frozenset(rhs)
+        except TypeError:
+            # unhashable members can only be scanned for
+            return super().compile_constant(lhs, rhs)
+        container = rhs  # type: Container
+
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)
+            try:
+                return value in members
+            except TypeError:
+                return value in container
+        return evaluate
+
 
 @register(Contains)
 class ContainsWrapper(LookupWrapper[Contains]):
     __slots__ = ()  # type: Slots
     op = operator.contains
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        # applying the operator directly saves a call per row, over using `op`
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: Container
+            return rhs in value
+        return evaluate
+
 
 @register(IContains)
 class IContainsWrapper(LookupWrapper[IContains]):
@@ -573,12 +872,30 @@ class IContainsWrapper(LookupWrapper[IContains]):
             return rhs.lower() in lhs.lower()
         return rhs in lhs
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        if not rhs:
+            return super().compile_constant(lhs, rhs)
+        lowered = rhs.lower()  # type: str
+
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: str
+            if value:
+                return lowered in value.lower()
+            return rhs in value
+        return evaluate
+
 
 @register(StartsWith)
 class StartsWithWrapper(LookupWrapper[StartsWith]):
     __slots__ = ()  # type: Slots
     op = str.startswith
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: str
+            return value.startswith(rhs)
+        return evaluate
+
 
 @register(IStartsWith)
 class IStartsWithWrapper(LookupWrapper[IStartsWith]):
@@ -591,20 +908,47 @@ class IStartsWithWrapper(LookupWrapper[IStartsWith]):
         # unsure on this..
         return lhs.startswith(rhs)
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        if not rhs:
+            return super().compile_constant(lhs, rhs)
+        lowered = rhs.lower()  # type: str
+
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: str
+            if value:
+                return value.lower().startswith(lowered)
+            return value.startswith(rhs)
+        return evaluate
+
 
 @register(EndsWith)
 class EndsWithWrapper(LookupWrapper[EndsWith]):
     __slots__ = ()  # type: Slots
     op = str.endswith
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: str
+            return value.endswith(rhs)
+        return evaluate
+
 
 @register(IEndsWith)
 class IEndsWithWrapper(LookupWrapper[IEndsWith]):
     __slots__ = ()  # type: Slots
+
     @staticmethod
     def op(lhs: AnyStr, rhs: AnyStr) -> bool:
         return lhs.lower().endswith(rhs.lower())
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        lowered = rhs.lower()  # type: str
+
+        def evaluate(obj: Any) -> bool:
+            value = lhs(obj)  # type: str
+            return value.lower().endswith(lowered)
+        return evaluate
+
 
 Rangeable_T = TypeVar('Rangeable_T', int, date)
 
@@ -615,7 +959,15 @@ class RangeWrapper(LookupWrapper[Range]):
 
     @staticmethod
     def op(lhs: Rangeable_T, rhs: Tuple[Rangeable_T, Rangeable_T]) -> bool:
-        return rhs[0] >= lhs <= rhs[1]
+        return rhs[0] <= lhs <= rhs[1]
+
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        lower, upper = rhs
+
+        def evaluate(obj: Any) -> bool:
+            in_range = lower <= lhs(obj) <= upper  # type: bool
+            return in_range
+        return evaluate
 
 
 @register(IsNull)
@@ -629,6 +981,11 @@ class IsNullWrapper(LookupWrapper[IsNull]):
         return lhs is not None
 
 
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, flags: int) -> Pattern[str]:
+    return re.compile(pattern, flags=flags)
+
+
 @register(Regex)
 class RegexWrapper(LookupWrapper[Regex], Generic[T_Lookup]):
     __slots__ = ()  # type: Slots
@@ -636,9 +993,16 @@ class RegexWrapper(LookupWrapper[Regex], Generic[T_Lookup]):
 
     @classmethod
     def op(cls, lhs: str, rhs: str) -> bool:
-        re_rhs = re.compile(rhs, flags=cls.re_flags)
+        re_rhs = _compile_regex(rhs, cls.re_flags)
         return bool(re_rhs.search(lhs))
 
+    def compile_constant(self, lhs: Evaluator, rhs: Any) -> Evaluator:
+        search = re.compile(rhs, flags=self.re_flags).search
+
+        def evaluate(obj: Any) -> bool:
+            return bool(search(lhs(obj)))
+        return evaluate
+
 
 @register(IRegex)
 class IRegexWrapper(RegexWrapper[IRegex]):
@@ -647,47 +1011,87 @@ class IRegexWrapper(RegexWrapper[IRegex]):
 
 
 @register(Q)
-class QWrapper(ExpressionWrapper[Q]):
+class QWrapper(CompiledExpressionWrapper[Q]):
     __slots__ = ()  # type: Slots
 
-    def as_python(self, obj: Model) -> bool:
-        expanded_query = expand_query(obj._meta.model, self.expression)
-        wrapped = wrap(expanded_query)
-        return cast(SupportsPythonComparison, wrapped).as_python(obj)
+    def compile(self) -> Evaluator:
+        query = self.expression
+        # expanding depends only on the model, so is shared by all its instances
+        compiled_by_model = {}  # type: Dict[Type[Model], Evaluator]
+
+        def evaluate(obj: Model) -> bool:
+            model = obj._meta.model
+            try:
+                compiled = compiled_by_model[model]
+            except KeyError:
+                wrapped = cast(SupportsPythonComparison, wrap(expand_query(model, query)))
+                compiled = compiled_by_model[model] = compile_wrapped(wrapped)
+            return cast(bool, compiled(obj))
+        return evaluate
 
 
 class ConditionNotMet(Exception):
     pass
 
 
+# returned to a `Case` by a `When` whose condition isn't met. Raising for it
+# instead would cost far more, as it's the common case for all but one `When`.
+_NOT_MET = object()
+
+
 @register(Case)
-class CaseWrapper(ExpressionWrapper[Case]):
+class CaseWrapper(CompiledExpressionWrapper[Case]):
     __slots__ = ()  # type: Slots
 
-    def as_python(self, obj: Any) -> Any:
+    def compile(self) -> Evaluator:
         statement = self.expression
-        for case in statement.cases:  # type: When
-            wrapped_case = wrap(case)
-            try:
-                value = wrapped_case.as_python(obj)
-                break
-            except ConditionNotMet:
-                pass
-        else:
-            value = wrap(statement.default).as_python(obj)
-        return value
+        cases = [cast(WhenWrapper, wrap(case))._compile_branch() for case in statement.cases]
+        default = compile_wrapped(wrap(statement.default))
+
+        def evaluate(obj: Any) -> Any:
+            for case in cases:
+                value = case(obj)
+                if value is not _NOT_MET:
+                    return value
+            return default(obj)
+        return evaluate
+
+    def is_constant(self) -> bool:
+        statement = self.expression
+        return (
+            all(is_constant(wrap(case)) for case in statement.cases)
+            and is_constant(wrap(statement.default))
+        )
 
 
 @register(When)
-class WhenWrapper(ExpressionWrapper[When]):
+class WhenWrapper(CompiledExpressionWrapper[When]):
     __slots__ = ()  # type: Slots
 
-    def as_python(self, obj: Any) -> Any:
+    def compile(self) -> Evaluator:
+        branch = self._compile_branch()
+
+        def evaluate(obj: Any) -> Any:
+            value = branch(obj)
+            if value is _NOT_MET:
+                raise ConditionNotMet
+            return value
+        return evaluate
+
+    def _compile_branch(self) -> Evaluator:
+        statement = self.expression
+        condition = compile_wrapped(wrap(statement.condition))
+        result = compile_wrapped(wrap(statement.result))
+
+        def evaluate(obj: Any) -> Any:
+            if condition(obj):
+                return result(obj)
+            return _NOT_MET
+        return evaluate
+
+    def is_constant(self) -> bool:
         statement = self.expression
-        wrapped_condition = wrap(statement.condition)
-        if wrapped_condition.as_python(obj):
-            return wrap(statement.result).as_python(obj)
-        raise ConditionNotMet
+        return is_constant(wrap(statement.condition)) and is_constant(wrap(statement.result))
 
 
 if django.VERSION < (2,):
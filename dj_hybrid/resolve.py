@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from operator import attrgetter
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 from django.db.models import Model
 from django.db.models.constants import LOOKUP_SEP
@@ -48,7 +48,7 @@ class DictResolver(IResolver):
 
 
 class DjangoResolver(AttributeResolver):
-    pass
+    __slots__ = ()
 
 
 def get_resolver(doc: Any) -> IResolver:
@@ -58,3 +58,10 @@ def get_resolver(doc: Any) -> IResolver:
         return DictResolver(doc)
     else:
         return AttributeResolver(doc)
+
+
+def get_accessor(doc_type: type, path: str) -> Callable[[Any], Any]:
+    path = '.'.join(path.split(LOOKUP_SEP))
+    if issubclass(doc_type, Mapping) and not issubclass(doc_type, Model):
+        return nested_itemgetter(path)
+    return attrgetter(path)
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import pytest
+from django.db.models import Case, ExpressionWrapper, F, IntegerField, Q, Value, When
+from django.db.models.functions import ConcatPair, Lower
+from django.db.models.lookups import GreaterThan
+
+from dj_hybrid.expression_wrapper.base import CompiledExpressionWrapper, FakeQuery
+from dj_hybrid.expression_wrapper.wrap import wrap
+from dj_hybrid.expression_wrapper.wrappers import ConcatPairWrapper
+
+
+def test_compiles_once(mocker):
+    wrapped = wrap(Value(20) + Value(2))
+    spied_compile = mocker.spy(type(wrapped), 'compile')
+
+    assert isinstance(wrapped, CompiledExpressionWrapper)
+    assert wrapped.as_python(None) == 22
+    assert wrapped.as_python(None) == 22
+    assert spied_compile.call_count == 1
+
+
+def test_resolving_recompiles():
+    wrapped = wrap(Value(20) + Value(2))
+    wrapped.as_python(None)
+    compiled = wrapped._compiled
+
+    resolved = wrapped.resolve_expression(FakeQuery())
+    assert resolved._compiled is None
+    assert wrapped._compiled is compiled
+
+    assert resolved.as_python(None) == 22
+    assert resolved._compiled is not compiled
+
+
+def test_nested_dicts():
+    wrapped = wrap(F('a__b__c'))
+    objs = [dict(a=dict(b=dict(c=1))), dict(a=dict(b=dict(c=2)))]
+
+    assert [wrapped.as_python(obj) for obj in objs] == [1, 2]
+
+
+def test_mixed_objects():
+    wrapped = wrap(F('a'))
+    objs = [dict(a=1), SimpleNamespace(a=2), dict(a=3)]
+
+    assert [wrapped.as_python(obj) for obj in objs] == [1, 2, 3]
+
+
+@pytest.mark.parametrize('expression,expected', [
+    (Value(20) + Value(2), True),
+    (Lower(Value('HELLO')), True),
+    (ExpressionWrapper(Value(20) * Value(2), output_field=IntegerField()), True),
+    (GreaterThan(Value(3, output_field=IntegerField()), Value(2)), True),
+    (Case(default=Value(3)), True),
+    (GreaterThan(ExpressionWrapper(F('a'), output_field=IntegerField()), Value(2)), False),
+    (Case(When(Q(a=1), then=Value(1)), default=Value(3)), False),
+    (F('a') + Value(2), False),
+    (Lower(F('s')), False),
+])
+def test_is_constant(expression, expected):
+    assert wrap(expression).is_constant() is expected
+
+
+def test_constant_folding(mocker):
+    spied_concat = mocker.spy(ConcatPairWrapper, 'op')
+    wrapped = wrap(ConcatPair(F('s'), ConcatPair(Value('-'), Value('world'))))
+
+    assert wrapped.as_python(dict(s='hello')) == 'hello-world'
+    assert wrapped.as_python(dict(s='goodbye')) == 'goodbye-world'
+    # once for each object, and only once for the constant side
+    assert spied_concat.call_count == 3
+
+
+def test_constant_folding_defers_errors():
+    wrapped = wrap(Value(1) / Value(0))
+
+    with pytest.raises(ZeroDivisionError):
+        wrapped.as_python(None)
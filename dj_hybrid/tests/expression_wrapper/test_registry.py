@@ -76,3 +76,16 @@ def test_double_register():
         registry.registry.register(key, val)
 
     registry.registry.unregister(key)
+
+
+def test_registered_wrappers_are_slotted():
+    # wrappers are created for every node of every expression, so none of them
+    # should be carrying a `__dict__` around
+    wrapper_classes = {
+        wrapper
+        for wrapper in registry.registry.registry.values()
+        if isinstance(wrapper, type)
+    }
+    assert wrapper_classes
+    for wrapper_class in wrapper_classes:
+        assert not hasattr(wrapper_class.__new__(wrapper_class), '__dict__'), wrapper_class
@@ -3,6 +3,7 @@ from inspect import Signature
 from dj_hybrid.expression_wrapper import wrap
 from dj_hybrid.expression_wrapper.registry import registry
 from dj_hybrid.tests.utils import not_raises
+from dj_hybrid.types import SupportsPython
 
 
 class FakeSupportsPython:
@@ -47,3 +48,27 @@ def test_get_wrapper():
     assert wrap.get_wrapper(ObjToRegister()) is FakeWrapper
 
     registry.unregister(ObjToRegister)
+
+
+def test_supports_python(mocker):
+    # fresh types, so nothing is cached for them yet
+    Supported = type('Supported', (FakeSupportsPython,), {})
+    Unsupported = type('Unsupported', (FakeWrapper,), {})
+    spied_check = mocker.spy(type(SupportsPython), '__instancecheck__')
+
+    assert wrap.supports_python(Supported())
+    assert wrap.supports_python(Supported())
+    assert not wrap.supports_python(Unsupported(None))
+    assert not wrap.supports_python(Unsupported(None))
+    # answered from the cache the second time around
+    assert spied_check.call_count == 2
+
+
+def test_supports_python_class(mocker):
+    spied_check = mocker.spy(type(SupportsPython), '__instancecheck__')
+
+    # a class is checked for itself, rather than through its type
+    assert wrap.supports_python(FakeSupportsPython)
+    assert wrap.supports_python(FakeSupportsPython)
+    assert not wrap.supports_python(FakeWrapper)
+    assert spied_check.call_count == 3
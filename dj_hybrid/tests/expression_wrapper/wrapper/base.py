@@ -4,7 +4,7 @@ from typing import ClassVar, Union, Mapping, Any, Type
 import pytest
 
 from dj_hybrid.expression_wrapper.base import FakeQuery
-from dj_hybrid.expression_wrapper.convert import get_converters, apply_converters
+from dj_hybrid.expression_wrapper.convert import compile_converters, get_connection, get_converters, get_db
 from dj_hybrid.expression_wrapper.types import SupportsResolving, SupportsConversion, Wrapper
 from dj_hybrid.expression_wrapper.wrap import wrap
 
@@ -63,8 +63,10 @@ class WrapperTestBase:
         wrapped = self.resolve(self.get_wrapped(), model_instance)
         as_python = wrapped.as_python(model_instance)
         for_converting = self.get_expression_for_converting(wrapped)
-        converters = get_converters(for_converting, model_instance)
-        return apply_converters(as_python, converters, model_instance)
+        convert = compile_converters(get_converters(for_converting, model_instance))
+        if convert is None:
+            return as_python
+        return convert(as_python, get_connection(get_db(model_instance)))
 
     def get_from_database(self, model_instance):
         expression = self.get_expression()
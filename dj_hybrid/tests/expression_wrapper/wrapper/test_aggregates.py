@@ -0,0 +1,62 @@
+import statistics
+from decimal import Decimal
+
+import pytest
+from django.db.models import Avg, F, Max, Min, StdDev, Sum, Variance
+
+from dj_hybrid.expression_wrapper import wrappers
+from dj_hybrid.expression_wrapper.wrap import wrap
+
+
+@pytest.fixture(params=['numpy', 'no numpy'])
+def numpy_available(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(wrappers, 'numpy', None)
+
+
+@pytest.mark.parametrize('aggregate,expected_op', [
+    (Avg, statistics.mean),
+    (StdDev, statistics.stdev),
+    (Variance, statistics.variance),
+    (Sum, sum),
+    (Max, max),
+    (Min, min),
+])
+@pytest.mark.parametrize('values', [
+    [1.5, 2.25, 8., 3.],
+    [1, 2, 8, 3],
+    (Decimal('1.5'), Decimal('2.25'), Decimal('8')),
+    # enough for numpy to be used, when it's available
+    [value * 1.5 for value in range(200)],
+])
+@pytest.mark.usefixtures('numpy_available')
+def test_aggregate(aggregate, expected_op, values):
+    wrapped = wrap(aggregate(F('values')))
+    value = wrapped.as_python(dict(values=values))
+    assert value == pytest.approx(expected_op(values))
+    assert type(value) in (int, float, Decimal)
+
+
+@pytest.mark.parametrize('aggregate,values', [
+    (Avg, []),
+    (StdDev, [1.]),
+    (Variance, [1.]),
+])
+@pytest.mark.usefixtures('numpy_available')
+def test_too_few_values(aggregate, values):
+    wrapped = wrap(aggregate(F('values')))
+    with pytest.raises(statistics.StatisticsError):
+        wrapped.as_python(dict(values=values))
+
+
+@pytest.mark.parametrize('aggregate,expected_op', [
+    (Avg, statistics.mean),
+    (StdDev, statistics.stdev),
+    (Variance, statistics.variance),
+])
+def test_aggregate_iterator(aggregate, expected_op):
+    values = [1.5, 2.25, 8., 3.]
+    wrapped = wrap(aggregate(F('values')))
+    assert wrapped.as_python(dict(values=iter(values))) == pytest.approx(expected_op(values))
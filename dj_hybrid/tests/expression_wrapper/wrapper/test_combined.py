@@ -0,0 +1,36 @@
+import pytest
+from django.db.models import F, Value
+
+from dj_hybrid.expression_wrapper.wrap import wrap
+
+
+@pytest.mark.parametrize('expression,expected', [
+    (F('a') + F('b'), 9),
+    (F('a') - F('b'), 5),
+    (F('a') * F('b'), 14),
+    (F('a') / F('b'), 3.5),
+    (F('a') % F('b'), 1),
+    (F('a').bitand(F('b')), 2),
+    (F('a').bitor(F('b')), 7),
+    (F('a').bitleftshift(F('b')), 28),
+    (F('a').bitrightshift(F('b')), 1),
+])
+def test_connectors(expression, expected):
+    wrapped = wrap(expression)
+    obj = dict(a=7, b=2)
+    assert wrapped.as_python(obj) == expected
+
+
+@pytest.mark.parametrize('expression,expected,operand_count', [
+    (F('a') + F('b') + F('c') + F('d'), 16, 4),
+    (F('a') - F('b') - F('c'), 1, 3),
+    (F('a') / F('b') / F('c'), 0.875, 3),
+    (F('a') + F('b') * F('c') + F('d'), 18, 3),
+    (F('a') - (F('b') - F('c')), 9, 2),
+    ((Value(1) + Value(2)) + F('a') + F('b'), 12, 3),
+])
+def test_chains(expression, expected, operand_count):
+    wrapped = wrap(expression)
+    obj = dict(a=7, b=2, c=4, d=3)
+    assert len(wrapped.get_chained_operands()) == operand_count
+    assert wrapped.as_python(obj) == expected
@@ -1,5 +1,5 @@
-from django.db.models import F, CharField
-from django.db.models.functions import Cast
+from django.db.models import F, CharField, Value
+from django.db.models.functions import Cast, Concat
 
 from .base import WrapperTestBase
 from .factory import FTestingFactory
@@ -57,3 +57,12 @@ class TestCasting(Base):
     fixture = dict(
         int_field=50
     )
+
+
+class TestConcat(Base):
+    expression = Concat(F('str_field'), Value('-'), F('int_field'), output_field=CharField())
+    python_value = "hello-26"
+    fixture = dict(
+        str_field='hello',
+        int_field=26,
+    )
@@ -0,0 +1,46 @@
+import pytest
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Lower, Upper
+
+from dj_hybrid.expression_wrapper.wrap import wrap
+
+
+@pytest.mark.parametrize('obj,expected', [
+    (dict(a=1, b=2), 1),
+    (dict(a=None, b=2), 2),
+    (dict(a=None, b=None), 3),
+])
+def test_coalesce(obj, expected):
+    wrapped = wrap(Coalesce(F('a'), F('b'), Value(3)))
+    assert wrapped.as_python(obj) == expected
+
+
+@pytest.mark.parametrize('obj,expected', [
+    (dict(a=1, b=2), 1),
+    (dict(a=0, b=2), 0),
+    (dict(a=None, b=2), 2),
+    (dict(a=None, b=None), None),
+])
+def test_coalesce_pair(obj, expected):
+    wrapped = wrap(Coalesce(F('a'), F('b')))
+    assert wrapped.as_python(obj) == expected
+
+
+def test_coalesce_is_lazy():
+    # `missing` can't be resolved, but is never needed
+    wrapped = wrap(Coalesce(F('a'), F('missing')))
+    assert wrapped.as_python(dict(a=1)) == 1
+
+
+@pytest.mark.parametrize('function,value,expected', [
+    (Lower, 'HeLLo', 'hello'),
+    (Lower, '', ''),
+    (Lower, None, None),
+    (Lower, 0, 0),
+    (Upper, 'HeLLo', 'HELLO'),
+    (Upper, None, None),
+    (Upper, 0, 0),
+])
+def test_case_transforms(function, value, expected):
+    wrapped = wrap(function(F('a')))
+    assert wrapped.as_python(dict(a=value)) == expected
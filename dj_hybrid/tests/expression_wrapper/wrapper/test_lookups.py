@@ -0,0 +1,111 @@
+import pytest
+from django.db.models import CharField, ExpressionWrapper, F, IntegerField, Value
+from django.db.models.lookups import (
+    Contains,
+    EndsWith,
+    IContains,
+    IEndsWith,
+    IExact,
+    In,
+    IRegex,
+    IStartsWith,
+    Range,
+    Regex,
+    StartsWith,
+)
+
+from dj_hybrid.expression_wrapper.wrap import wrap
+from dj_hybrid.expression_wrapper.wrappers import RangeWrapper
+
+
+def field(name):
+    return ExpressionWrapper(F(name), output_field=CharField())
+
+
+@pytest.mark.parametrize('lookup,value,expected', [
+    (Regex(field('str_field'), Value(r'^h.l')), 'hello', True),
+    (Regex(field('str_field'), Value(r'^h.l')), 'Hello', False),
+    (IRegex(field('str_field'), Value(r'^h.l')), 'Hello', True),
+    (IRegex(field('str_field'), Value(r'^h.l')), 'goodbye', False),
+    (Regex(field('str_field'), field('pattern')), 'hello', True),
+    (Regex(field('str_field'), field('pattern')), 'Hello', False),
+])
+def test_regex(lookup, value, expected):
+    wrapped = wrap(lookup)
+    obj = dict(str_field=value, pattern=r'^h.l')
+    assert wrapped.as_python(obj) is expected
+    # the second evaluation goes through the already compiled lookup
+    assert wrapped.as_python(obj) is expected
+
+
+@pytest.mark.parametrize('lookup_class,value,rhs,expected', [
+    (IExact, 'Hello', 'hELLO', True),
+    (IExact, 'Hello', 'hell', False),
+    (IExact, '', 'hello', False),
+    (IExact, 'hello', '', False),
+    (IExact, '', '', True),
+    (IContains, 'Hello', 'ELL', True),
+    (IContains, 'Hello', 'ELO', False),
+    (IContains, '', 'ell', False),
+    (IContains, 'Hello', '', True),
+    (IStartsWith, 'Hello', 'hE', True),
+    (IStartsWith, 'Hello', 'lo', False),
+    (IStartsWith, '', 'he', False),
+    (IStartsWith, 'Hello', '', True),
+    (IEndsWith, 'Hello', 'LO', True),
+    (IEndsWith, 'Hello', 'he', False),
+])
+def test_case_insensitive(lookup_class, value, rhs, expected):
+    assert_lookup(lookup_class, value, rhs, expected)
+
+
+@pytest.mark.parametrize('lookup_class,value,rhs,expected', [
+    (Contains, 'Hello', 'ell', True),
+    (Contains, 'Hello', 'ELL', False),
+    (Contains, 'Hello', '', True),
+    (StartsWith, 'Hello', 'He', True),
+    (StartsWith, 'Hello', 'he', False),
+    (EndsWith, 'Hello', 'lo', True),
+    (EndsWith, 'Hello', 'LO', False),
+])
+def test_case_sensitive(lookup_class, value, rhs, expected):
+    assert_lookup(lookup_class, value, rhs, expected)
+
+
+def assert_lookup(lookup_class, value, rhs, expected):
+    obj = dict(str_field=value, rhs=rhs)
+    with_constant = wrap(lookup_class(field('str_field'), Value(rhs)))
+    with_varying = wrap(lookup_class(field('str_field'), field('rhs')))
+
+    assert with_constant.as_python(obj) is expected
+    assert with_varying.as_python(obj) is expected
+
+
+@pytest.mark.parametrize('value,rhs,expected', [
+    ('hello', ['hello', 'goodbye'], True),
+    ('hello', ('hi', 'goodbye'), False),
+    (['he', 'llo'], [['he', 'llo']], True),
+    ('hello', [['he', 'llo']], False),
+])
+def test_in(value, rhs, expected):
+    wrapped = wrap(In(field('str_field'), Value(rhs)))
+    assert wrapped.as_python(dict(str_field=value)) is expected
+
+
+@pytest.mark.parametrize('value,expected', [
+    (0, False),
+    (1, True),
+    (3, True),
+    (5, True),
+    (6, False),
+])
+def test_range(value, expected):
+    lhs = ExpressionWrapper(F('int_field'), output_field=IntegerField())
+    wrapped = wrap(Range(lhs, Value((1, 5))))
+    assert wrapped.as_python(dict(int_field=value)) is expected
+
+
+def test_range_op():
+    assert RangeWrapper.op(3, (1, 5)) is True
+    assert RangeWrapper.op(0, (1, 5)) is False
+    assert RangeWrapper.op(6, (1, 5)) is False
@@ -2,6 +2,7 @@ import pytest
 from django.db import models
 from django.db.models import Case, Q, Value, When
 
+from dj_hybrid.expression_wrapper import wrappers
 from dj_hybrid.expression_wrapper.wrap import wrap
 
 
@@ -22,6 +23,16 @@ def test_query():
     assert expected == wrapped.as_python(instance)
 
 
+@pytest.mark.django_db(transaction=True)
+def test_query_expands_once(mocker):
+    mocked_expand = mocker.spy(wrappers, 'expand_query')
+    wrapped = wrap(Q(int_field__gt=20))
+
+    assert wrapped.as_python(ControlFlowModel(int_field=50)) is True
+    assert wrapped.as_python(ControlFlowModel(int_field=10)) is False
+    assert mocked_expand.call_count == 1
+
+
 @pytest.mark.django_db(transaction=True)
 def test_case():
     expected = "Woot!"
@@ -33,3 +44,30 @@ def test_case():
     instance = ControlFlowModel(int_field=23)
 
     assert expected == wrapped.as_python(instance)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize('int_field,expected', [
+    (10, "low"),
+    (23, "Woot!"),
+    (50, "default"),
+])
+def test_case_default(int_field, expected):
+    expression = Case(
+        When(int_field__lt=20, then=Value("low")),
+        When(int_field=23, then=Value("Woot!")),
+        default=Value("default"),
+    )
+    wrapped = wrap(expression)
+    instance = ControlFlowModel(int_field=int_field)
+
+    assert expected == wrapped.as_python(instance)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_when_not_met():
+    wrapped = wrap(When(int_field=23, then=Value("Woot!")))
+
+    assert wrapped.as_python(ControlFlowModel(int_field=23)) == "Woot!"
+    with pytest.raises(wrappers.ConditionNotMet):
+        wrapped.as_python(ControlFlowModel(int_field=10))
@@ -111,6 +111,19 @@ def test_caching_behaviour__instance(mocker):
     assert mocked_wrap.call_count == 2
 
 
+def test_caching_behaviour__converters(mocker):
+    mocked_get_converters = mocker.spy(decorator, 'get_converters')  # type: Mock
+    SomeClass = get_some_class()
+
+    assert SomeClass(int_field=1).int_field_alias == 1
+    assert SomeClass(int_field=2).int_field_alias == 2
+    assert mocked_get_converters.call_count == 1
+
+    SomeClass.__dict__['int_field_alias'].reset_cache()
+    assert SomeClass(int_field=3).int_field_alias == 3
+    assert mocked_get_converters.call_count == 2
+
+
 def test_dependency_fetching__no_dependencies():
     klass = get_some_class()
     expected = [klass.int_field_alias]
@@ -151,3 +151,15 @@ def test_negated_empty_as_a_sibling():
     expanded = expand_query(FakeModel, query)
     assert are_equal(expected, expanded)
     assert wrap(expanded).as_python(dict(int_field=1))
+
+
+@pytest.mark.parametrize('obj,expected', [
+    (dict(char_field='', int_field=2), True),
+    (dict(char_field='', int_field=1), False),
+    (dict(char_field='a', int_field=2), False),
+])
+def test_combined_evaluation(obj, expected):
+    query = Q(char_field='') & ~Q(int_field=1)
+    expanded = expand_query(FakeModel, query)
+    assert expanded.as_python(obj) is expected
+    assert expanded.compile()(obj) is expected
@@ -1,4 +1,7 @@
-from .utils import not_raises
+import pytest
+from django.db.models import F
+
+from .utils import are_equal, not_raises
 
 
 class CustomException(Exception):
@@ -26,3 +29,14 @@ def test_not_utils():
         assert not e
 
 
+@pytest.mark.parametrize('vals,expected', [
+    ((1, 1, 1), True),
+    ((1, 1, 2), False),
+    (([1, 2], [1, 2], [1, 2]), True),
+    (([1, 2], [1, 2], (1, 2)), False),
+    (([1, 2], [1, 2], [1]), False),
+    ((F('a'), F('a'), F('a')), True),
+    ((F('a'), F('a'), F('b')), False),
+])
+def test_are_equal(vals, expected):
+    assert are_equal(*vals) is expected
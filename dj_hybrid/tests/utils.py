@@ -1,9 +1,8 @@
 from collections import Iterable
-from contextlib import contextmanager
-from functools import singledispatch
-from itertools import combinations, chain
+from functools import lru_cache, singledispatch
+from itertools import chain
 
-from typing import Union, Type, Any, Sequence, Callable, TypeVar
+from typing import Union, Type, Any, Sequence, Callable, TypeVar, Tuple, FrozenSet, Optional
 
 import django
 from django.db.models import Lookup, Expression, Field
@@ -22,33 +21,46 @@ T = TypeVar('T')
 _UNSET = object()
 
 
-@contextmanager
-def not_raises(exception: ExceptionType) -> None:
-    try:
-        yield
-    except exception as e:
-        raise AssertionError("Did raise: {}".format(e))
+class not_raises:
+    __slots__ = (
+        'exception',
+    )
+
+    def __init__(self, exception: ExceptionType) -> None:
+        self.exception = exception
+
+    def __enter__(self) -> 'not_raises':
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], tb: Any) -> None:
+        if exc_type is not None and issubclass(exc_type, self.exception):
+            raise AssertionError("Did raise: {}".format(exc))
 
 
 @singledispatch
 def are_equal(*vals: T) -> bool:
-    return all(
-        v1 == v2
-        for v1, v2 in combinations(vals, 2)
-    )
+    """Whether all of `vals` are equal
+
+    Equality is transitive, so each of these only compares against the first value.
+    """
+    first = vals[0]
+    return all(v == first for v in vals[1:])
 
 
 @are_equal.register(list)
 @are_equal.register(tuple)
 def iterable_equal(*vals: T) -> bool:
+    first = vals[0]
+    first_type = type(first)
+    first_len = len(first)
     return all(
-        type(v1) is type(v2)
-        and len(v1) == len(v2)
+        type(v) is first_type
+        and len(v) == first_len
         and all(
             are_equal(i1, i2)
-            for i1, i2 in zip(v1, v2)
+            for i1, i2 in zip(first, v)
         )
-        for v1, v2 in combinations(vals, 2)
+        for v in vals[1:]
     )
 
 
@@ -56,19 +68,16 @@ def compare_factory(*parameters: Sequence[str]) -> Callable[..., bool]:
     def comparer(*vals):
         # type: (*T) -> bool
         nonlocal parameters
-        return all(
-            bool(
-                type(v1) is type(v2)
-                and all(
-                    are_equal(
-                        getattr(v1, p, _UNSET),
-                        getattr(v2, p, _UNSET),
-                    )
-                    for p in parameters
-                )
-            )
-            for v1, v2 in combinations(vals, 2)
-        )
+        first = vals[0]
+        first_type = type(first)
+        first_attributes = [(p, getattr(first, p, _UNSET)) for p in parameters]
+        for v in vals[1:]:
+            if type(v) is not first_type:
+                return False
+            for p, attribute in first_attributes:
+                if not are_equal(attribute, getattr(v, p, _UNSET)):
+                    return False
+        return True
     return comparer
 
 
@@ -80,27 +89,40 @@ are_equal.register(Not, compare_factory('expression'))
 _IGNORED_ATTRIBUTES = {
     '__dict__',
     '_constructor_args',
+    '_compiled',
 }
 
+
+@lru_cache(maxsize=None)
+def _get_type_attributes(cls: type) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """The names of `cls`' cached properties, and of the rest of its slots"""
+    cached_properties = frozenset(k for k, v in cls.__dict__.items() if isinstance(v, cached_property))
+    attributes = frozenset(chain.from_iterable(getattr(base, '__slots__', ()) for base in cls.__mro__))
+    return cached_properties, attributes - cached_properties - _IGNORED_ATTRIBUTES
+
+
+@lru_cache(maxsize=None)
+def _get_comparer(attributes: FrozenSet[str]) -> Callable[..., bool]:
+    return compare_factory(*attributes)
+
+
 def compare_dicts(*vals: T):
     # This isn't strictly safe, however for our usecase, it's fine.
     # We need to not compare anything that's cached, as the other may also be cached
-    cached_properties = set(k for k, v in type(vals[0]).__dict__.items() if isinstance(v, cached_property))
-    attributes = set(chain.from_iterable(getattr(cls, '__slots__', ()) for cls in type(vals[0]).__mro__))
+    cached_properties, attributes = _get_type_attributes(type(vals[0]))
     if hasattr(vals[0], '__dict__'):
         check_dict = lambda v1, v2: len(set(v1.__dict__) - cached_properties) == len(set(v2.__dict__) - cached_properties)
-        attributes |= set(vals[0].__dict__)
+        attributes |= set(vals[0].__dict__) - cached_properties - _IGNORED_ATTRIBUTES
     else:
         check_dict = lambda v1, v2: True
 
-    attributes -= cached_properties
-    attributes -= _IGNORED_ATTRIBUTES
-    comparer = compare_factory(*attributes)
+    comparer = _get_comparer(attributes)
+    first = vals[0]
     return all(
-        type(v1) is type(v2)
-        and check_dict(v1, v2)
-        and comparer(v1, v2)
-        for v1, v2 in combinations(vals, 2)
+        type(v) is type(first)
+        and check_dict(first, v)
+        and comparer(first, v)
+        for v in vals[1:]
     )
 
 
@@ -109,10 +131,12 @@ are_equal.register(ExpressionWrapper, compare_dicts)
 
 @are_equal.register(Field)
 def compare_field(*vals: T) -> bool:
+    first = vals[0]
+    first_kwargs = first.deconstruct()[1]
     return all(
-        type(v1) is type(v2)
-        and v1.deconstruct()[1] == v2.deconstruct()[1]
-        for v1, v2 in combinations(vals, 2)
+        type(v) is type(first)
+        and v.deconstruct()[1] == first_kwargs
+        for v in vals[1:]
     )
 
 
@@ -122,12 +146,14 @@ are_equal.register(Col, compare_factory('alias', 'target', '_output_field_or_non
 if django.VERSION < (2,):
     are_equal.register(F, compare_factory('name'))
 
+    _compare_output_field = compare_factory('_output_field_or_none')
+
     @are_equal.register(Expression)
     def compare_expression(*vals: T) -> bool:
-        compare_output_field = compare_factory('_output_field_or_none')
+        first = vals[0]
         return all(
-            type(v1) is type(v2)
-            and compare_output_field(v1, v2)
-            and compare_dicts(v1, v2)
-            for v1, v2 in combinations(vals, 2)
+            type(v) is type(first)
+            and _compare_output_field(first, v)
+            and compare_dicts(first, v)
+            for v in vals[1:]
         )
@@ -1,4 +1,7 @@
-from typing import Any, Callable, Generic, Mapping, Optional, Type, TypeVar, Union, overload
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Generic, Mapping, MutableMapping, Optional, Type, TypeVar, Union, overload
+from weakref import WeakKeyDictionary
 
 from django.utils.functional import cached_property as django_cached_property
 
@@ -6,12 +9,45 @@ ObjectStructure = Mapping[str, Any]
 NestedItemCallable = Callable[[ObjectStructure], Any]
 
 
+@lru_cache(maxsize=1024)
 def nested_itemgetter(item: str) -> NestedItemCallable:
+    if '.' not in item:
+        # nothing to walk through, so this can be done entirely in C
+        return itemgetter(item)
+
+    getters = tuple(itemgetter(key) for key in item.split('.'))
+
     def inner(obj: ObjectStructure) -> Any:
-        return resolve_item(obj, item)
+        for getter in getters:
+            obj = getter(obj)
+        return obj
     return inner
 
 
+# Checking against a runtime protocol walks every member of the protocol with hasattr.
+# For protocols made up of methods the answer only depends on the type,
+# so it's worked out once for each type we see.
+_implements = WeakKeyDictionary()  # type: MutableMapping[type, Dict[type, bool]]
+
+
+def implements(obj: Any, protocol: type) -> bool:
+    """Cached `isinstance(obj, protocol)`, for runtime protocols made up of methods"""
+    if isinstance(obj, type):
+        # a class can provide the methods itself, so there's no type to share with
+        return isinstance(obj, protocol)
+
+    obj_type = type(obj)
+    try:
+        checked = _implements[obj_type]
+    except KeyError:
+        checked = _implements[obj_type] = {}
+    try:
+        return checked[protocol]
+    except KeyError:
+        result = checked[protocol] = isinstance(obj, protocol)
+        return result
+
+
 def resolve_item(obj: ObjectStructure, item: str) -> Any:
     for key in item.split('.'):
         obj = obj[key]
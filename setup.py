@@ -6,6 +6,7 @@ tests_require = [
     "pytest-django",
     "pytest-factoryboy",
     "pytest-mock",
+    "pytest-xdist",
 ]
 
 
@@ -13,5 +14,6 @@ setup(
     tests_require=tests_require,
     extras_require={
         'test': tests_require,
+        'numpy': ['numpy'],
     }
 )